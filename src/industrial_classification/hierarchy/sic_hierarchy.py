@@ -10,7 +10,10 @@ Usage:
 
 import html
 import re
-from collections.abc import Iterator
+import sys
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from operator import attrgetter
 
 import pandas as pd
 
@@ -21,12 +24,29 @@ from industrial_classification.utils.constants import (
     SIX_DIGITS,
 )
 
+# Code references are plain ASCII, so match \s and \d without Unicode lookups
 SEE_CODE_REGEX = re.compile(
-    r"(,?\s?see\s(divisions?\s)?)?##\d+(\.\d+(\/\d)?)?", re.IGNORECASE
+    r"(,?\s?see\s(divisions?\s)?)?##\d+(\.\d+(\/\d)?)?", re.IGNORECASE | re.ASCII
 )
+_remove_see_code = SEE_CODE_REGEX.sub
+
+# Padding to six characters, indexed by the number of 'x' needed
+_X_PAD = ("", "x", "xx", "xxx", "xxxx", "xxxxx")
 
 _LEVEL_DICT = {1: "section", 2: "division", 3: "group", 4: "class", 5: "subclass"}
 
+# Formatters for unpadded alpha_codes, keyed by length
+_CODE_FORMATTERS = {
+    1: lambda code: code,
+    3: lambda code: code[1:3],
+    4: lambda code: f"{code[1:3]}.{code[3:]}",
+    5: lambda code: f"{code[1:3]}.{code[3:]}",
+    6: lambda code: f"{code[1:3]}.{code[3:5]}/{code[5]}",
+}
+
+# Length of the parent's unpadded alpha_code, keyed by the child's n_digits
+_PARENT_CODE_LEN = {2: 1, 3: 3, 4: 4, 5: 5}
+
 
 class SicCode:
     """Standard Industrial Classification code.
@@ -52,13 +72,21 @@ class SicCode:
         is defined in UK SIC 2007.
     """
 
+    __slots__ = (
+        "_alpha_code_no_pad",
+        "_formatted_code",
+        "alpha_code",
+        "level_name",
+        "n_digits",
+    )
+
     def __init__(self, alpha_code: str):
         SicCode._validate_alpha_code(alpha_code)
 
         self.alpha_code = alpha_code
         self.n_digits = SicCode._parse_digits(alpha_code)
         self.level_name = _LEVEL_DICT[self.n_digits]
-        self._formatted_code = SicCode._format_code(alpha_code)
+        self._formatted_code: str | None = None
         self._alpha_code_no_pad = self.alpha_code.replace("x", "")
 
     @staticmethod
@@ -106,8 +134,7 @@ class SicCode:
             case _:
                 alpha_code = f"{section}{code}"
 
-        pad = 6 - len(alpha_code)
-        alpha_code += "x" * pad
+        alpha_code = sys.intern(alpha_code.ljust(SIX_DIGITS, "x"))
 
         return SicCode(alpha_code)
 
@@ -202,46 +229,65 @@ class SicCode:
         """
         alpha_code = alpha_code.replace("x", "")
 
-        formatted_code = None
-
-        match len(alpha_code):
-            case 1:
-                formatted_code = alpha_code
-            case 3:
-                formatted_code = alpha_code[1:3]
-            case 4 | 5:
-                formatted_code = f"{alpha_code[1:3]}.{alpha_code[3:]}"
-            case 6:
-                formatted_code = f"{alpha_code[1:3]}.{alpha_code[3:5]}/{alpha_code[5]}"
+        formatter = _CODE_FORMATTERS.get(len(alpha_code))
 
-        if formatted_code is None:
+        if formatter is None:
             raise ValueError(f'Unable to format code: "{alpha_code}"')
 
-        return formatted_code
+        return formatter(alpha_code)
+
+    @property
+    def formatted_code(self) -> str:
+        """The readable form of the code (e.g. "01.11"), formatted on first use.
+
+        Returns:
+            str: The formatted code.
+        """
+        if self._formatted_code is None:
+            self._formatted_code = SicCode._format_code(self.alpha_code)
 
-    def __str__(self):
         return self._formatted_code
 
+    def __str__(self):
+        return self.formatted_code
+
     def __repr__(self):
         repr_str = f'SicCode("{self.alpha_code}")'
         return repr_str
 
 
-class SicNode:
+class SicNode:  # pylint: disable=too-many-instance-attributes
     """Tree data structure where the nodes hold all data associated with a given SIC.
 
     The SIC hierarchy is represented as several separate trees,
     with each section (e.g. "A", "B", "C") as a root node.
+
+    Once the hierarchy is loaded, nodes are frozen and `children` and
+    `activities` are tuples.
     """
 
+    __slots__ = (
+        "_frozen",
+        "_numeric_string_padded",
+        "activities",
+        "children",
+        "description",
+        "parent",
+        "sic_code",
+        "sic_meta",
+    )
+
     def __init__(self, sic_code: SicCode, description: str):
         self.sic_code = sic_code
         self.description = description
 
-        self.activities: list[str] = []
+        self.activities: Sequence[str] = []
         self.sic_meta = None
         self.parent = None
-        self.children: list[SicNode] = []
+        self.children: Sequence[SicNode] = []
+
+        self._frozen = False
+        self._numeric_string_padded: str | None = None
 
     def __repr__(self):
         return f'SicNode({self.sic_code!r}, "{self.description}")'
@@ -282,17 +328,37 @@ class SicNode:
         """
         return not self.children
 
+    def freeze(self):
+        """Stores children and activities as tuples once the hierarchy is built.
+
+        Warning:
+            Children must not be added after this, as cached values such as
+            `numeric_string_padded` depend on whether the node is a leaf.
+        """
+        self.children = tuple(self.children)
+        self.activities = tuple(self.activities)
+        self._frozen = True
+
     def numeric_string_padded(self):
         """Generates a numeric string representation of the SIC code, padded if necessary.
 
+        The padding depends on whether the node is a leaf, so the result is
+        only cached once the node has been frozen by `load_hierarchy`.
+
         Returns:
             str: The padded numeric string.
         """
+        if self._numeric_string_padded is not None:
+            return self._numeric_string_padded
+
         numeric_string = self.sic_code.alpha_code[1:].replace("x", "")
 
         if self.sic_code.n_digits == FOUR_DIGITS and self.is_leaf():
             numeric_string += "0"
 
+        if self._frozen:
+            self._numeric_string_padded = numeric_string
+
         return numeric_string
 
 
@@ -307,7 +373,8 @@ class SIC:
     """
 
     def __init__(self, nodes, code_lookup):
-        self.nodes = sorted(nodes, key=lambda node: node.sic_code)
+        # Sort on the key SicCode.__lt__ compares, resolved once per node
+        self.nodes = sorted(nodes, key=attrgetter("sic_code._alpha_code_no_pad"))
         self._code_lookup = code_lookup
 
     def __getitem__(self, key):
@@ -350,48 +417,43 @@ class SIC:
         Returns:
             pd.DataFrame: A DataFrame with columns `code` and `text`.
         """
-        description_df = pd.DataFrame(self.all_leaf_descriptions())
-        activity_df = pd.DataFrame(self.all_leaf_activities())
-
-        df = pd.concat([description_df, activity_df], ignore_index=True)
-        df = df.drop_duplicates()
-        df = df.sort_values("code")
-        df = df.reset_index(drop=True).copy()
+        # Collect (code, text) pairs in a dict to drop duplicates
+        rows: dict[tuple[str, str], None] = {}
 
-        df["code"] = df["code"].apply(str)
+        for node in self:
+            if node.is_leaf():
+                code = str(node.sic_code)
+                rows[(code, node.description)] = None
+                rows.update(((code, activity), None) for activity in node.activities)
 
-        return df
+        return pd.DataFrame(sorted(rows), columns=["code", "text"])
 
 
 def _define_codes_and_nodes(
     sic_df,
-) -> tuple[list[SicCode], list[SicNode], dict[SicCode, SicNode]]:
+) -> tuple[list[SicNode], dict[str, SicNode]]:
     """Defines SIC codes and nodes from a DataFrame.
 
     Args:
         sic_df (pd.DataFrame): The DataFrame containing SIC data.
 
     Returns:
-        tuple: A tuple containing a list of SicCode, a list of SicNode, and a
-               dictionary mapping SicCode to SicNode.
+        tuple: A tuple containing a list of SicNode and a dictionary mapping
+               alpha_code to SicNode.
     """
-    codes = []
-    nodes = []
-
-    code_node_dict = {}
-
-    for description, section, code, level in sic_df[
-        ["description", "section", "most_disaggregated_level", "level_headings"]
-    ].itertuples(index=False, name=None):
-        sic_code = SicCode.from_section_code_level(section, code, level)
-
-        sic_node = SicNode(sic_code, description=description)
+    nodes = [
+        SicNode(
+            SicCode.from_section_code_level(section, code, level),
+            description=description,
+        )
+        for description, section, code, level in sic_df[
+            ["description", "section", "most_disaggregated_level", "level_headings"]
+        ].itertuples(index=False, name=None)
+    ]
 
-        codes.append(sic_code)
-        nodes.append(sic_node)
-        code_node_dict[sic_code] = sic_node
+    code_node_dict = {node.sic_code.alpha_code: node for node in nodes}
 
-    return codes, nodes, code_node_dict
+    return nodes, code_node_dict
 
 
 def _populate_parent_child_relationships(nodes, code_node_dict):
@@ -399,30 +461,21 @@ def _populate_parent_child_relationships(nodes, code_node_dict):
 
     Args:
         nodes (list[SicNode]): The list of SIC nodes.
-        code_node_dict (dict[SicCode, SicNode]): A dictionary mapping SicCode to SicNode.
+        code_node_dict (dict[str, SicNode]): A dictionary mapping alpha_code to SicNode.
 
     Warning:
         Modifies nodes in place.
     """
     for node in nodes:
-        if node.sic_code.n_digits > 1:
-            match node.sic_code.n_digits:
-                case 2:
-                    parent_code = node.sic_code.alpha_code[0]
-                case 3:
-                    parent_code = node.sic_code.alpha_code[:3]
-                case 4:
-                    parent_code = node.sic_code.alpha_code[:4]
-                case 5:
-                    parent_code = node.sic_code.alpha_code[:5]
-                case _:
-                    raise ValueError(f"No parent found for '{node.sic_code}'")
-
-            pad = 6 - len(parent_code)
-            parent_code += "x" * pad
-            parent_sic_code = SicCode(parent_code)
-
-            parent_node = code_node_dict[parent_sic_code]
+        sic_code = node.sic_code
+        n_digits = sic_code.n_digits
+        if n_digits > 1:
+            parent_len = _PARENT_CODE_LEN[n_digits]
+            parent_code = (
+                sic_code.alpha_code[:parent_len] + _X_PAD[SIX_DIGITS - parent_len]
+            )
+
+            parent_node = code_node_dict[parent_code]
 
             parent_node.children.append(node)
             node.parent = parent_node
@@ -433,7 +486,7 @@ def _populate_sic_meta(nodes, code_node_dict):
 
     Args:
         nodes (list[SicNode]): The list of SIC nodes.
-        code_node_dict (dict[SicCode, SicNode]): A dictionary mapping SicCode to SicNode.
+        code_node_dict (dict[str, SicNode]): A dictionary mapping alpha_code to SicNode.
 
     Warning:
         Modifies nodes in place.
@@ -445,8 +498,7 @@ def _populate_sic_meta(nodes, code_node_dict):
         raise ValueError("Mismatch in SIC data sources: sicDB.sic_meta and sic_df")
 
     for meta in sicDB.sic_meta:
-        sic_code = SicCode(meta.code)
-        sic_node = code_node_dict[sic_code]
+        sic_node = code_node_dict[meta.code]
 
         sic_node.sic_meta = _clean_meta(meta)
 
@@ -464,35 +516,43 @@ def _populate_activities(nodes, sic_index_df):
     padded_digits_to_sic_codes = {}
 
     for sic_node in nodes:
+        n_digits = sic_node.sic_code.n_digits
+        alpha_code = sic_node.sic_code.alpha_code
         sic_digits = None
-        if sic_node.sic_code.n_digits == FOUR_DIGITS:
-            sic_digits = sic_node.sic_code.alpha_code[1:5] + "0"
-        if sic_node.sic_code.n_digits == FIVE_DIGITS:
-            sic_digits = sic_node.sic_code.alpha_code[1:6]
+        if n_digits == FOUR_DIGITS:
+            sic_digits = alpha_code[1:5] + "0"
+        if n_digits == FIVE_DIGITS:
+            sic_digits = alpha_code[1:6]
 
         if sic_digits:
             padded_digits_to_sic_codes[sic_digits] = sic_node
 
-    for sic_digits, activity in sic_index_df[["uk_sic_2007", "activity"]].itertuples(
-        index=False, name=None
+    get_node = padded_digits_to_sic_codes.__getitem__
+
+    for sic_digits, activity in zip(
+        sic_index_df["uk_sic_2007"].to_numpy().tolist(),
+        sic_index_df["activity"].to_numpy().tolist(),
+        strict=True,
     ):
-        padded_digits_to_sic_codes[sic_digits.strip()].activities.append(activity)
+        get_node(sic_digits.strip()).activities.append(activity)
 
 
+@lru_cache(maxsize=4096)
 def _clean_text(text):
     """Cleans text by unescaping HTML and removing specific patterns.
 
+    Results are cached as the same includes/excludes text recurs across codes.
+
     Args:
         text (str): The text to clean.
 
     Returns:
         str: The cleaned text.
     """
-    clean_text = html.unescape(text)
+    # Most SIC text has no HTML entities, so skip unescaping when there is no "&"
+    clean_text = html.unescape(text) if "&" in text else text
 
-    clean_text = re.sub(SEE_CODE_REGEX, "", clean_text)
-
-    return clean_text
+    return _remove_see_code("", clean_text)
 
 
 def _clean_meta(meta):
@@ -505,8 +565,8 @@ def _clean_meta(meta):
         object: The cleaned metadata object.
     """
     clean_detail = _clean_text(meta.detail)
-    clean_includes = [_clean_text(text) for text in meta.includes]
-    clean_excludes = [_clean_text(text) for text in meta.excludes]
+    clean_includes = tuple(_clean_text(text) for text in meta.includes)
+    clean_excludes = tuple(_clean_text(text) for text in meta.excludes)
 
     cleaned_meta = sicDB.ClassificationMeta(
         code=meta.code,
@@ -519,6 +579,34 @@ def _clean_meta(meta):
     return cleaned_meta
 
 
+def _lookup_keys(node):
+    """Generates the keys a SIC node can be looked up by.
+
+    Args:
+        node (SicNode): The SIC node.
+
+    Returns:
+        set[str]: The lookup keys, deduplicated as several formats coincide
+            (e.g. for sections).
+    """
+    sic_code = node.sic_code
+    alpha_code = sic_code.alpha_code
+    n_digits = sic_code.n_digits
+    stripped_code = alpha_code.replace("x", "")
+
+    # Format the key directly so the code's own formatted_code stays lazy
+    formatted_code = _CODE_FORMATTERS[len(stripped_code)](stripped_code)
+
+    keys = {formatted_code, alpha_code, stripped_code}
+    if n_digits > 1:
+        keys.add(stripped_code[1:])
+
+    if n_digits == FOUR_DIGITS and not node.children:
+        keys.add(alpha_code[1:5] + "0")
+
+    return keys
+
+
 def load_hierarchy(sic_df, sic_index_df):
     """Creates the SIC hierarchy from supporting data.
 
@@ -529,8 +617,7 @@ def load_hierarchy(sic_df, sic_index_df):
     Returns:
         SIC: An instance of the SIC class providing access to the hierarchy.
     """
-    # Codes is unused but we need to unpack it to ensure the correct order
-    _codes, nodes, code_node_dict = _define_codes_and_nodes(sic_df)
+    nodes, code_node_dict = _define_codes_and_nodes(sic_df)
 
     _populate_parent_child_relationships(nodes, code_node_dict)
 
@@ -538,17 +625,10 @@ def load_hierarchy(sic_df, sic_index_df):
 
     _populate_activities(nodes, sic_index_df)
 
-    lookup = {}
-
+    # The hierarchy is read-only from here
     for node in nodes:
-        lookup[str(node.sic_code)] = node
-        lookup[node.sic_code.alpha_code] = node
-        lookup[node.sic_code.alpha_code.replace("x", "")] = node
-        if node.sic_code.n_digits > 1:
-            lookup[node.sic_code.alpha_code[1:].replace("x", "")] = node
-
-        if node.sic_code.n_digits == FOUR_DIGITS and not node.children:
-            key = node.sic_code.alpha_code[1:5] + "0"
-            lookup[key] = node
+        node.freeze()
+
+    lookup = {key: node for node in nodes for key in _lookup_keys(node)}
 
     return SIC(nodes, lookup)
@@ -9,12 +9,21 @@ Classes:
 
 """
 
+from collections import defaultdict
+from collections.abc import Callable
+from functools import cached_property
 from typing import Any, Optional, Union
 
 import pandas as pd
 
 from industrial_classification.meta.sic_meta import SicMeta
-from industrial_classification.utils.constants import FOUR_DIGITS
+from industrial_classification.utils.constants import FIVE_DIGITS
+
+# Above this share of rows, confirming shortlisted candidates one by one is
+# slower than a vectorised substring scan over every description
+_FULL_SCAN_SHARE = 0.1
+# End words shorter than this match too many indexed words to narrow the search
+_MIN_AFFIX_LENGTH = 3
 
 
 class SICLookup:
@@ -40,20 +49,38 @@ class SICLookup:
             data_path (str): The path to the CSV file containing SIC data.
         """
         # Load data and store descriptions in lowercase
-        self.data: pd.DataFrame = pd.read_csv(data_path)
-        self.data["description"] = self.data["description"].str.lower()
-
         # Some codes are 4 digits because they come from the 0x class
         # prepend a 0 to make 5 digits
-        self.data["label"] = self.data["label"].apply(
-            lambda x: f"0{x}" if len(str(x)) == FOUR_DIGITS else str(x)
+        # Read labels as strings so missing ones stay missing instead of padding "nan"
+        data = pd.read_csv(data_path, dtype={"label": "string"})
+        self.data: pd.DataFrame = data.assign(
+            description=data["description"].str.lower(),
+            label=data["label"].str.zfill(FIVE_DIGITS),
         )
 
-        self.lookup_dict: dict[str, str] = self.data.set_index("description").to_dict()[
-            "label"
-        ]
+        self.lookup_dict: dict[str, str] = (
+            self.data.dropna(subset=["label"])
+            .set_index("description")
+            .to_dict()["label"]
+        )
         self.meta: SicMeta = SicMeta(retrofit_keys=True)
 
+        self._descriptions: list[Any] = self.data["description"].tolist()
+
+    @cached_property
+    def _token_index(self) -> dict[str, set[int]]:
+        """Maps each description word to the rows it appears in.
+
+        Built on the first multi-word similarity lookup, so loading the data
+        does not pay for it.
+        """
+        token_index: defaultdict[str, set[int]] = defaultdict(set)
+        for row, text in enumerate(self._descriptions):
+            if isinstance(text, str):
+                for token in text.split():
+                    token_index[token].add(row)
+        return dict(token_index)
+
     def lookup(self, description: str, similarity: bool = False) -> dict[str, Any]:
         """Looks up an SIC code based on the given description.
 
@@ -87,15 +114,13 @@ class SICLookup:
 
         if similarity:
             # Check if the description is mentioned elsewhere in the dataset
-            matches = self.data[
-                self.data["description"].str.contains(description, na=False)
-            ]
-            potential_codes = matches["label"].unique()
+            matches = self._rows_containing(description)
+            potential_codes = matches["label"].dropna().unique()
 
             if len(potential_codes) == 1 and potential_codes[0] == matching_code:
                 potential_codes = []  # Set it as an empty list instead of a dictionary
                 potential_descriptions = []
-                matches = []
+                matches = matches.iloc[0:0]
 
             else:
                 potential_codes = potential_codes.tolist()
@@ -134,6 +159,71 @@ class SICLookup:
 
         return response
 
+    def _rows_with_word(self, predicate: Callable[[str], bool]) -> set[int]:
+        """Collects the rows containing any indexed word accepted by the predicate."""
+        return set().union(
+            *(rows for word, rows in self._token_index.items() if predicate(word))
+        )
+
+    def _rows_containing(self, text: str) -> pd.DataFrame:
+        """Finds the rows whose description contains the given text.
+
+        Candidate rows are shortlisted from the token index, then confirmed with
+        a plain substring check rather than scanning every description. The
+        query's end words are matched against every indexed word, so each call
+        also scans the vocabulary. Single-word queries, queries with nothing
+        long enough to index on, and shortlists covering a large share of the
+        rows use a vectorised scan instead.
+
+        Args:
+            text (str): The lowercase text to search for.
+
+        Returns:
+            pd.DataFrame: The matching rows, in their original order.
+        """
+        tokens = text.split()
+        # A single word can match part way through any indexed word, so the
+        # index cannot narrow it down more cheaply than scanning the rows
+        if len(tokens) <= 1:
+            return self._scan_rows(text)
+
+        # Inner words must match whole words, but the first and last words
+        # may be cut short where they meet the rest of the description
+        first, last = tokens[0], tokens[-1]
+        postings = [self._token_index.get(token, set()) for token in tokens[1:-1]]
+        if len(first) >= _MIN_AFFIX_LENGTH:
+            postings.append(self._rows_with_word(lambda word: word.endswith(first)))
+        if len(last) >= _MIN_AFFIX_LENGTH:
+            postings.append(self._rows_with_word(lambda word: word.startswith(last)))
+        if not postings:
+            return self._scan_rows(text)
+
+        candidates = set.intersection(*postings)
+
+        if len(candidates) > _FULL_SCAN_SHARE * len(self._descriptions):
+            return self._scan_rows(text)
+
+        descriptions = self._descriptions
+        rows = [
+            row
+            for row in sorted(candidates)
+            if isinstance(description := descriptions[row], str) and text in description
+        ]
+        return self.data.iloc[rows]
+
+    def _scan_rows(self, text: str) -> pd.DataFrame:
+        """Finds the rows whose description contains the text with a full scan.
+
+        Args:
+            text (str): The lowercase text to search for.
+
+        Returns:
+            pd.DataFrame: The matching rows, in their original order.
+        """
+        return self.data[
+            self.data["description"].str.contains(text, regex=False, na=False)
+        ]
+
     def lookup_code_division(
         self, code: str
     ) -> dict[str, Optional[Union[str, dict[str, Any]]]]:
@@ -153,17 +243,18 @@ class SICLookup:
         self, sic_candidates: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
         """Retrieve unique code divisions from SIC candidates."""
-        unique_divisions: dict[str, dict[str, Any]] = {}
-
-        for candidate in sic_candidates:
-            division_info = self.lookup_code_division(candidate["sic_code"])
-            code_division = division_info["code_division"]
-
-            # Only add unique divisions
-            if isinstance(code_division, str) and code_division not in unique_divisions:
-                unique_divisions[code_division] = division_info
+        # Dedupe on the division first so metadata is fetched once per division
+        code_divisions = dict.fromkeys(
+            candidate["sic_code"][:2] for candidate in sic_candidates
+        )
 
-        return list(unique_divisions.values())
+        return [
+            {
+                "code_division": code_division,
+                "code_division_meta": self.meta.get_meta_by_code(code_division),
+            }
+            for code_division in code_divisions
+        ]
 
 
 class SICRephraseLookup:
@@ -196,14 +287,19 @@ class SICRephraseLookup:
             "rephrased_description"
         ].to_dict()
 
+    def _lookup_description(self, sic_code: Union[str, int]) -> Optional[str]:
+        """Return the rephrased description for the given SIC code, if any."""
+        return self.lookup_dict.get(str(sic_code))
+
     def lookup(self, sic_code: Union[str, int]) -> dict[str, Union[str, Any]]:
         """Retrieve the rephrased description for the given SIC code."""
         sic_code = str(sic_code)
+        rephrased_description = self._lookup_description(sic_code)
 
-        if sic_code in self.lookup_dict:
+        if rephrased_description is not None:
             return {
                 "sic_code": sic_code,
-                "rephrased_description": self.lookup_dict[sic_code],
+                "rephrased_description": rephrased_description,
             }
 
         return {"sic_code": sic_code, "error": "SIC code not found"}
@@ -211,27 +307,16 @@ class SICRephraseLookup:
     def process_json(self, input_json: dict[str, Any]) -> dict[str, Any]:
         """Process a JSON response to rephrase SIC descriptions."""
         # Update main SIC description
-        rephrased_sic_description: Optional[dict[str, Union[str, Any]]] = None
-
-        rephrased_sic_description = (
-            self.lookup(input_json["sic_code"])
+        input_json["sic_description"] = (
+            self._lookup_description(input_json["sic_code"])
             if input_json["sic_code"] is not None
             else None
         )
 
-        if rephrased_sic_description:
-            input_json["sic_description"] = rephrased_sic_description[
-                "rephrased_description"
-            ]
-        else:
-            input_json["sic_description"] = None
-
         # Update SIC candidates
         for candidate in input_json["sic_candidates"]:
-            rephrased_descriptive = self.lookup(candidate["sic_code"])
-            if rephrased_descriptive:
-                candidate["sic_descriptive"] = rephrased_descriptive[
-                    "rephrased_description"
-                ]
+            rephrased_description = self._lookup_description(candidate["sic_code"])
+            if rephrased_description is not None:
+                candidate["sic_descriptive"] = rephrased_description
 
         return input_json
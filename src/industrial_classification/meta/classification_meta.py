@@ -6,48 +6,156 @@ descriptions, and inclusion/exclusion lists, as well as methods for code
 matching and formatted output.
 
 Classes:
-    ClassificationMeta: A Pydantic model for industrial classification metadata.
+    ClassificationMeta: A frozen dataclass for industrial classification metadata.
 """
 
-from pydantic import BaseModel, Field
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from importlib import import_module
+from typing import Any, NotRequired, TypedDict
 
 from industrial_classification.utils.constants import MIN_DIGITS
 
+_EMPTY: tuple[str, ...] = ()
+_DEFAULT_SUBSET_DIGITS: frozenset[int] = frozenset({2, 4})
 
-class ClassificationMeta(BaseModel):
+
+class _ClassificationMetaData(TypedDict):
+    """Field values accepted by `ClassificationMeta.parse`."""
+
+    code: str
+    title: str
+    detail: NotRequired[str]
+    includes: NotRequired[list[str]]
+    excludes: NotRequired[list[str]]
+
+
+@cache
+def _data_adapter() -> Any:
+    """Build the pydantic validator used by `ClassificationMeta.parse`.
+
+    pydantic is imported and the schema built on first use, so importing this
+    module does not pay for them.
+
+    Returns:
+        pydantic.TypeAdapter: The validator for `_ClassificationMetaData`.
+    """
+    pydantic = import_module("pydantic")
+    schema = pydantic.with_config(pydantic.ConfigDict(extra="forbid"))(
+        _ClassificationMetaData
+    )
+    return pydantic.TypeAdapter(schema)
+
+
+@dataclass(slots=True, frozen=True)
+class ClassificationMeta:  # pylint: disable=too-many-instance-attributes
     """Represents a classification meta model.
 
+    Instances are immutable and built once per code from static metadata,
+    so the fields are not validated on construction. Use `parse` for data
+    that has not been checked. Includes and excludes are stored as tuples,
+    and missing ones share a single empty tuple.
+
     Attributes:
         code (str): Category code. Either a full code or a partial code for a
             larger hierarchical group.
             Partial code has last digits replaced by 'x'.
         title (str): Short descriptive title of the code category.
         detail (str): Descriptive label of the category associated with the code.
-        includes (list[str]): Optional list of titles that should be included
+        includes (tuple[str, ...]): Optional titles that should be included
             in this category.
-        excludes (list[str]): Optional list of titles that should be excluded
+        excludes (tuple[str, ...]): Optional titles that should be excluded
             from this category.
     """
 
-    code: str = Field(
-        description="""Category code. Either a full code or a partial code
-        for a larger hierarchical group.
-        Partial code has last digits replaced by 'x'."""
+    code: str = field(
+        metadata={
+            "description": "Category code. Either a full code or a partial code "
+            "for a larger hierarchical group. "
+            "Partial code has last digits replaced by 'x'."
+        }
+    )
+    title: str = field(
+        metadata={"description": "Short descriptive title of the code category."}
     )
-    title: str = Field(description="Short descriptive title of the code category.")
-    detail: str = Field(
+    detail: str = field(
         default="",
-        description="Descriptive label of the category associated with code.",
+        metadata={
+            "description": "Descriptive label of the category associated with code."
+        },
     )
-    includes: list[str] = Field(
-        default=[],
-        description="Optional list of titles that should be included in this category",
+    includes: tuple[str, ...] = field(
+        default=_EMPTY,
+        metadata={
+            "description": "Optional list of titles that should be included in this category"
+        },
     )
-    excludes: list[str] = Field(
-        default=[],
-        description="""Optional list of titles that should be excluded from
-            this category""",
+    excludes: tuple[str, ...] = field(
+        default=_EMPTY,
+        metadata={
+            "description": "Optional list of titles that should be excluded from "
+            "this category"
+        },
     )
+    # Numeric part of the code without the section letter or 'x' padding
+    _code_digits: str = field(init=False, repr=False, compare=False)
+    # Comma-separated includes and excludes used by pretty_print
+    _includes_str: str = field(init=False, repr=False, compare=False)
+    _excludes_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any sequence, e.g. lists, but store tuples so instances hash
+        object.__setattr__(self, "includes", tuple(self.includes) or _EMPTY)
+        object.__setattr__(self, "excludes", tuple(self.excludes) or _EMPTY)
+        object.__setattr__(self, "_code_digits", self.code[1:].replace("x", ""))
+        object.__setattr__(self, "_includes_str", ", ".join(self.includes))
+        object.__setattr__(self, "_excludes_str", ", ".join(self.excludes))
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Any], code: str | None = None
+    ) -> "ClassificationMeta":
+        """Creates an instance from a dictionary of field values.
+
+        String fields are interned, as the same titles and details are looked
+        up and compared repeatedly.
+
+        Args:
+            data (Mapping[str, Any]): Field values, e.g. a `SICmeta` entry.
+            code (str | None): The category code. Defaults to the `code` value
+                in data.
+
+        Returns:
+            ClassificationMeta: The new instance.
+        """
+        return cls(
+            code=sys.intern(data["code"] if code is None else code),
+            title=sys.intern(data["title"]),
+            detail=sys.intern(data.get("detail", "")),
+            includes=data.get("includes", _EMPTY),
+            excludes=data.get("excludes", _EMPTY),
+        )
+
+    @classmethod
+    def parse(cls, data: Any) -> "ClassificationMeta":
+        """Validates field values and creates an instance from them.
+
+        Unlike `from_dict`, the input is checked, so use this for data that
+        does not come from `SICmeta`.
+
+        Args:
+            data (Any): Field values, as accepted by `from_dict`.
+
+        Returns:
+            ClassificationMeta: The new instance.
+
+        Raises:
+            pydantic.ValidationError: If a field is missing, has the wrong
+                type or is not recognised.
+        """
+        return cls.from_dict(_data_adapter().validate_python(data))
 
     def check_code_match(self, subcode: str) -> bool:
         """Check for partial match of the code.
@@ -59,29 +167,40 @@ class ClassificationMeta(BaseModel):
         Returns:
             bool: if partial match found
         """
-        # pylint: disable=E1101
-        n = min(len(self.code.replace("x", "")), len(subcode) + 1)
-        # pylint: enable=E1101
-        return (n > MIN_DIGITS) & (self.code[1:n] == subcode[0 : (n - 1)])
+        code = self._code_digits
+        # The shorter of the two must be a prefix of the other
+        if len(code) <= len(subcode):
+            return len(code) >= MIN_DIGITS and subcode.startswith(code)
+        return len(subcode) >= MIN_DIGITS and code.startswith(subcode)
 
-    def pretty_print(self, subset_digits) -> str:
+    def pretty_print(self, subset_digits: int | Iterable[int] | None = None) -> str:
         """Prints nicely the present fields.
 
+        Args:
+            subset_digits (int | Iterable[int] | None): Code lengths to print.
+                Defaults to 2 and 4 digit codes. Pass a frozenset to skip
+                the conversion.
+
         Returns:
-            str: _description_
+            str: The formatted fields, or an empty string if the code length
+                is not in subset_digits.
         """
         if subset_digits is None:
-            subset_digits = [4, 2]
-
-        code = self.code[1:].replace("x", "")
-        if len(code) in subset_digits:
-            out = "Code " + code + ": " + self.title + ". "
-            if self.detail:
-                out += self.detail + ". "
-            if self.includes:
-                out += "Includes " + ", ".join(self.includes) + ". "
-            if self.excludes:
-                out += "Excludes " + ", ".join(self.excludes) + ". "
-        else:
-            out = ""
-        return out
+            subset_digits = _DEFAULT_SUBSET_DIGITS
+        elif isinstance(subset_digits, int):
+            subset_digits = frozenset((subset_digits,))
+        elif not isinstance(subset_digits, frozenset):
+            subset_digits = frozenset(subset_digits)
+
+        code = self._code_digits
+        if len(code) not in subset_digits:
+            return ""
+
+        parts = [f"Code {code}: {self.title}. "]
+        if self.detail:
+            parts.append(f"{self.detail}. ")
+        if self.includes:
+            parts.append(f"Includes {self._includes_str}. ")
+        if self.excludes:
+            parts.append(f"Excludes {self._excludes_str}. ")
+        return "".join(parts)
@@ -0,0 +1,205 @@
+"""Tests for the SIC hierarchy.
+
+This module contains pytest-based unit tests for the `SicCode`, `SicNode` and
+`SIC` classes, and for building the hierarchy with `load_hierarchy`.
+
+Fixtures:
+    sic_frames: Builds structure and index DataFrames from the SICmeta dictionary.
+    sic: Loads the SIC hierarchy from the generated DataFrames.
+"""
+
+# pylint: disable=redefined-outer-name
+
+import pandas as pd
+import pytest
+
+from industrial_classification.hierarchy.sic_hierarchy import (
+    SicCode,
+    SicNode,
+    load_hierarchy,
+)
+from industrial_classification.meta.sic_meta import (  # pylint: disable=no-name-in-module
+    SICmeta,
+)
+from industrial_classification.utils.constants import (
+    FIVE_DIGITS,
+    FOUR_DIGITS,
+    MIN_DIGITS,
+)
+
+_LEVEL_HEADINGS = {
+    1: "SECTION",
+    2: "Division",
+    3: "Group",
+    4: "Class",
+    5: "Sub Class",
+}
+
+
+@pytest.fixture(scope="module")
+def sic_frames():
+    """Builds SIC structure and index DataFrames from the SICmeta dictionary.
+
+    Classes without subclasses are written as 5-digit codes ending in zero,
+    matching the layout of the published SIC structure workbook.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The structure and index DataFrames.
+    """
+    digits = {code: code[1:].replace("x", "") for code in SICmeta}
+    parents = {d[:-1] for d in digits.values() if len(d) > MIN_DIGITS}
+
+    structure_rows = []
+    index_rows = []
+    for code, meta in SICmeta.items():
+        code_digits = digits[code]
+        n_digits = len(code_digits) or 1
+
+        if not code_digits:
+            structure_rows.append((meta["title"], code[0], code[0], "SECTION"))
+            continue
+
+        if n_digits == FOUR_DIGITS and code_digits not in parents:
+            code_digits += "0"
+        structure_rows.append(
+            (meta["title"], code[0], code_digits, _LEVEL_HEADINGS[n_digits])
+        )
+        if len(code_digits) == FIVE_DIGITS:
+            index_rows.append((code_digits, f"activity {code_digits}"))
+
+    sic_df = pd.DataFrame(
+        structure_rows,
+        columns=[
+            "description",
+            "section",
+            "most_disaggregated_level",
+            "level_headings",
+        ],
+    )
+    sic_index_df = pd.DataFrame(index_rows, columns=["uk_sic_2007", "activity"])
+    return sic_df, sic_index_df
+
+
+@pytest.fixture(scope="module")
+def sic(sic_frames):
+    """Loads the SIC hierarchy from the generated DataFrames.
+
+    Args:
+        sic_frames (tuple[pd.DataFrame, pd.DataFrame]): Structure and index data.
+
+    Returns:
+        SIC: The loaded SIC hierarchy.
+    """
+    return load_hierarchy(*sic_frames)
+
+
+@pytest.mark.sic_hierarchy
+def test_sic_code_equality_and_hash():
+    """Tests that SicCode equality and hashing delegate to alpha_code."""
+    code = SicCode("A0111x")
+    assert code == SicCode.from_section_code_level("A", "0111", "class")
+    assert hash(code) == hash("A0111x")
+    assert str(code) == "01.11"
+
+
+@pytest.mark.sic_hierarchy
+def test_sic_code_and_node_use_slots():
+    """Tests that SicCode and SicNode do not carry a per-instance __dict__."""
+    node = SicNode(SicCode("Axxxxx"), "AGRICULTURE, FORESTRY AND FISHING")
+    assert not hasattr(node.sic_code, "__dict__")
+    assert not hasattr(node, "__dict__")
+
+
+@pytest.mark.sic_hierarchy
+def test_load_hierarchy_relationships(sic):
+    """Tests that parent and child relationships are populated.
+
+    Args:
+        sic (SIC): The loaded SIC hierarchy.
+    """
+    assert len(sic) == len(SICmeta)
+
+    node = sic["01110"]
+    assert node.sic_code.alpha_code == "A0111x"
+    assert node.parent is sic["011"]
+    assert node.parent.parent is sic["01"]
+    assert node.parent.parent.parent is sic["A"]
+    assert node in node.parent.children
+    assert node.is_leaf()
+    assert node.activities == ("activity 01110",)
+    assert isinstance(node.parent.children, tuple)
+
+
+@pytest.mark.sic_hierarchy
+def test_load_hierarchy_lookup_keys(sic):
+    """Tests that nodes can be looked up by each supported code format.
+
+    Args:
+        sic (SIC): The loaded SIC hierarchy.
+    """
+    node = sic["A0111x"]
+    for key in ("01.11", "A0111", "0111", "01110"):
+        assert sic[key] is node
+
+    assert node.sic_code.formatted_code == "01.11"
+    assert node.numeric_string_padded() == "01110"
+    assert sic["01"].numeric_string_padded() == "01"
+
+
+@pytest.mark.sic_hierarchy
+def test_numeric_string_padded_follows_children():
+    """Tests that the padded code is not cached while children can still change."""
+    parent = SicNode(SicCode("A0111x"), "Growing of cereals")
+    assert parent.numeric_string_padded() == "01110"
+
+    parent.children.append(SicNode(SicCode("A01111"), "Growing of wheat"))
+    assert parent.numeric_string_padded() == "0111"
+
+    parent.freeze()
+    assert parent.numeric_string_padded() == "0111"
+    assert isinstance(parent.children, tuple)
+
+
+@pytest.mark.sic_hierarchy
+@pytest.mark.parametrize(
+    "section, code, level",
+    [
+        ("A", "01", "Group"),
+        ("A", "B", "SECTION"),
+        ("A", "01111", "Class"),
+        ("A", "011", "Sub Class"),
+        ("A", "011111", "Sub Class"),
+        ("A", "011111111111", "Sub Class"),
+    ],
+)
+def test_load_hierarchy_invalid_rows(sic_frames, section, code, level):
+    """Tests that inconsistent structure rows raise a ValueError.
+
+    Args:
+        sic_frames (tuple[pd.DataFrame, pd.DataFrame]): Structure and index data.
+        section (str): The section character of the invalid row.
+        code (str): The code of the invalid row.
+        level (str): The level heading of the invalid row.
+    """
+    sic_df, sic_index_df = sic_frames
+    invalid_row = pd.DataFrame(
+        [("Invalid", section, code, level)], columns=sic_df.columns
+    )
+
+    with pytest.raises(ValueError, match=r"mismatch|must end in zero|padded"):
+        load_hierarchy(pd.concat([sic_df, invalid_row]), sic_index_df)
+
+
+@pytest.mark.sic_hierarchy
+def test_all_leaf_text(sic):
+    """Tests that leaf text is deduplicated and sorted by code.
+
+    Args:
+        sic (SIC): The loaded SIC hierarchy.
+    """
+    df = sic.all_leaf_text()
+
+    assert list(df.columns) == ["code", "text"]
+    assert not df.duplicated().any()
+    assert df["code"].is_monotonic_increasing
+    assert ("01.11", "activity 01110") in set(df.itertuples(index=False))
@@ -6,6 +6,9 @@ provides functionality for looking up SIC codes and their associated metadata.
 Fixtures:
     mock_data: Creates a temporary CSV file with mock SIC data.
     sic_lookup: Creates an instance of SICLookup using the mock data.
+
+Both fixtures are module-scoped, so the CSV is written and loaded once and the
+lookup is shared by the tests, which only read from it.
 """
 
 # pylint: disable=redefined-outer-name
@@ -13,16 +16,18 @@ Fixtures:
 import pandas as pd
 import pytest
 
-from industrial_classification.lookup.sic_lookup import SICLookup
+from industrial_classification.lookup import sic_lookup as sic_lookup_module
+from industrial_classification.lookup.sic_lookup import SICLookup, SICRephraseLookup
 from industrial_classification.utils.constants import MIN_CLASSIFICATION_DIGITS
 
 
-@pytest.fixture
-def mock_data(tmp_path):
+@pytest.fixture(scope="module")
+def mock_data(tmp_path_factory):
     """Creates a temporary CSV file with mock SIC data.
 
     Args:
-        tmp_path (Path): Temporary directory provided by pytest.
+        tmp_path_factory (TempPathFactory): Temporary directory factory
+            provided by pytest.
 
     Returns:
         Path: Path to the temporary CSV file.
@@ -37,12 +42,12 @@ def mock_data(tmp_path):
             ],
         }
     )
-    file_path = tmp_path / "mock_data.csv"
+    file_path = tmp_path_factory.mktemp("sic_lookup") / "mock_data.csv"
     data.to_csv(file_path, index=False)
     return file_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sic_lookup(mock_data):
     """Creates an instance of SICLookup using the mock data.
 
@@ -156,3 +161,101 @@ def test_unique_code_divisions_with_duplicates(sic_lookup):
     assert len(result) == MIN_CLASSIFICATION_DIGITS
     assert any(div["code_division"] == "12" for div in result)
     assert any(div["code_division"] == "23" for div in result)
+
+
+@pytest.mark.sic_lookup
+def test_lookup_similarity_partial_words(sic_lookup):
+    """Tests similarity lookup where the text starts or ends part way through a word.
+
+    Args:
+        sic_lookup (SICLookup): Instance of the SICLookup class.
+    """
+    result = sic_lookup.lookup("iption t", similarity=True)
+    assert result["potential_matches"]["descriptions"] == [
+        "test description two",
+        "test description three",
+    ]
+
+    result = sic_lookup.lookup("(one)", similarity=True)
+    assert result["potential_matches"]["descriptions_count"] == 0
+
+
+@pytest.mark.sic_lookup
+def test_lookup_similarity_common_word(sic_lookup):
+    """Tests similarity lookup for a word found in every description.
+
+    Args:
+        sic_lookup (SICLookup): Instance of the SICLookup class.
+    """
+    result = sic_lookup.lookup("test", similarity=True)
+    assert result["potential_matches"]["descriptions"] == [
+        "test description one",
+        "test description two",
+        "test description three",
+    ]
+    assert result["potential_matches"]["codes"] == ["12345", "23456", "34567"]
+
+
+@pytest.mark.sic_lookup
+@pytest.mark.parametrize("text", ["test description", "iption t", "n t", "one two"])
+def test_rows_containing_index_matches_scan(sic_lookup, monkeypatch, text):
+    """Tests that the word index shortlist finds the same rows as a full scan.
+
+    Args:
+        sic_lookup (SICLookup): Instance of the SICLookup class.
+        monkeypatch (pytest.MonkeyPatch): Used to force the shortlist path.
+        text (str): The text to search for.
+    """
+    monkeypatch.setattr(sic_lookup_module, "_FULL_SCAN_SHARE", 1.0)
+    shortlisted = sic_lookup._rows_containing(text)  # pylint: disable=protected-access
+
+    assert shortlisted.equals(
+        sic_lookup._scan_rows(text)  # pylint: disable=protected-access
+    )
+
+
+@pytest.mark.sic_lookup
+def test_lookup_blank_label(tmp_path):
+    """Tests that a description with a blank label is not given a padded code.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "mock_blank_label.csv"
+    pd.DataFrame(
+        {
+            "label": ["1110", None],
+            "description": ["growing of wheat", "growing of unknown"],
+        }
+    ).to_csv(file_path, index=False)
+    lookup = SICLookup(data_path=str(file_path))
+
+    assert lookup.lookup("growing of wheat")["code"] == "01110"
+    assert lookup.lookup("growing of unknown")["code"] is None
+
+    result = lookup.lookup("growing of", similarity=True)
+    assert result["potential_matches"]["codes"] == ["01110"]
+
+
+@pytest.mark.sic_lookup
+def test_rephrase_process_json(tmp_path):
+    """Tests process_json with known and unknown SIC codes.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "mock_rephrased_data.csv"
+    pd.DataFrame(
+        {"sic_code": ["01110"], "rephrased_description": ["Crop growing"]}
+    ).to_csv(file_path, index=False)
+    rephrase_lookup = SICRephraseLookup(data_path=str(file_path))
+
+    result = rephrase_lookup.process_json(
+        {
+            "sic_code": "99999",
+            "sic_candidates": [{"sic_code": "01110"}, {"sic_code": "99999"}],
+        }
+    )
+    assert result["sic_description"] is None
+    assert result["sic_candidates"][0]["sic_descriptive"] == "Crop growing"
+    assert "sic_descriptive" not in result["sic_candidates"][1]
@@ -6,9 +6,33 @@ the presence of required fields. It also ensures that optional fields,
 if present, conform to the expected data types.
 """
 
+from typing import NotRequired, TypedDict
+
 import pytest
+from pydantic import ConfigDict, TypeAdapter, ValidationError, with_config
+
+from industrial_classification.meta.classification_meta import ClassificationMeta
+from industrial_classification.meta.sic_meta import (  # pylint: disable=no-name-in-module
+    SICmeta,
+    clear_caches,
+    find_matches,
+    match_many,
+    sic_meta,
+)
+
+
+@with_config(ConfigDict(strict=True, extra="forbid"))
+class _MetaSchema(TypedDict):
+    """Expected shape of a SICmeta entry."""
 
-from industrial_classification.meta.sic_meta import SICmeta
+    title: str
+    detail: NotRequired[str]
+    includes: NotRequired[list[str]]
+    excludes: NotRequired[list[str]]
+
+
+_SIC_META_ADAPTER = TypeAdapter(dict[str, dict], config=ConfigDict(strict=True))
+_ENTRY_ADAPTER = TypeAdapter(_MetaSchema)
 
 
 @pytest.mark.sic_meta
@@ -21,50 +45,150 @@ def test_sic_meta_structure():
     - SICmeta is a dictionary.
     - Each key in SICmeta is a string.
     - Each value in SICmeta is a dictionary.
+
+    The fields of each entry are checked by `test_sic_meta_entry`.
+
+    Raises:
+        pydantic.ValidationError: If any of the above conditions are not met.
+    """
+    _SIC_META_ADAPTER.validate_python(SICmeta)
+
+
+@pytest.mark.sic_meta
+@pytest.mark.parametrize(
+    "metadata", [pytest.param(meta, id=code) for code, meta in SICmeta.items()]
+)
+def test_sic_meta_entry(metadata):
+    """Test that a SICmeta entry matches `_MetaSchema`.
+
     - Required fields ('title') are present and of the correct type.
     - Optional fields ('detail', 'includes', 'excludes'), if present, conform
       to the expected data types.
 
+    Entries are separate test cases so they can be distributed across workers.
+
+    Args:
+        metadata (dict): The SICmeta entry to validate.
+
     Raises:
-        AssertionError: If any of the above conditions are not met.
+        pydantic.ValidationError: If the entry does not match the schema.
+    """
+    _ENTRY_ADAPTER.validate_python(metadata)
+
+
+@pytest.mark.sic_meta
+@pytest.mark.parametrize(
+    "subcode", ["0", "01", "011", "0111", "01110", "011101", "47", "4711", "99000"]
+)
+def test_find_matches_agrees_with_check_code_match(subcode):
+    """Test that find_matches returns the same entries as a full scan.
+
+    Args:
+        subcode (str): The subcode to match.
+    """
+    expected = tuple(meta for meta in sic_meta if meta.check_code_match(subcode))
+
+    assert find_matches(subcode) == expected
+    assert find_matches(subcode) is find_matches(subcode)
+
+
+@pytest.mark.sic_meta
+def test_clear_caches(monkeypatch):
+    """Test that clear_caches rebuilds the matches from the current SICmeta.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): Used to add a temporary SICmeta entry.
+    """
+    assert not find_matches("00000")
+
+    monkeypatch.setitem(SICmeta, "A0000x", {"title": "Temporary"})
+    clear_caches()
+    assert [meta.code for meta in find_matches("00000")] == ["A0000x"]
+
+    monkeypatch.undo()
+    clear_caches()
+    assert not find_matches("00000")
+
+
+@pytest.mark.sic_meta
+def test_match_many():
+    """Test that match_many matches each distinct subcode once."""
+    result = match_many(["01110", "47", "01110", "00000"])
+
+    assert list(result) == ["01110", "47", "00000"]
+    assert result["01110"] == find_matches("01110")
+    assert result["47"] == find_matches("47")
+    assert result["00000"] == ()
+
+
+@pytest.mark.sic_meta
+def test_sic_meta_fields_are_immutable():
+    """Test that includes and excludes are tuples and missing ones are shared."""
+    assert all(isinstance(meta.includes, tuple) for meta in sic_meta)
+    assert all(isinstance(meta.excludes, tuple) for meta in sic_meta)
+
+    empty = [meta.includes for meta in sic_meta if not meta.includes]
+    assert empty
+    assert all(includes is empty[0] for includes in empty)
+
+
+@pytest.mark.sic_meta
+def test_classification_meta_defaults_are_shared_tuples():
+    """Test that default includes/excludes are one shared empty tuple.
+
+    Tuple fields also make the frozen dataclass hashable, so instances can be
+    used as dictionary keys.
     """
-    # Ensure SICmeta is a dictionary
-    assert isinstance(SICmeta, dict), "SICmeta should be a dictionary"
-
-    for code, metadata in SICmeta.items():
-        # Ensure each key is a string
-        assert isinstance(code, str), f"Key '{code}' should be a string"
-
-        # Ensure each value is a dictionary
-        assert isinstance(
-            metadata, dict
-        ), f"Value for key '{code}' should be a dictionary"
-
-        # Check required fields in metadata
-        assert "title" in metadata, f"Key '{code}' is missing 'title'"
-        assert isinstance(
-            metadata["title"], str
-        ), f"'title' for key '{code}' should be a string"
-
-        if "detail" in metadata:
-            assert isinstance(
-                metadata["detail"], str
-            ), f"'detail' for key '{code}' should be a string"
-
-        if "includes" in metadata:
-            assert isinstance(
-                metadata["includes"], list
-            ), f"'includes' for key '{code}' should be a list"
-            for item in metadata["includes"]:
-                assert isinstance(
-                    item, str
-                ), f"Items in 'includes' for key '{code}' should be strings"
-
-        if "excludes" in metadata:
-            assert isinstance(
-                metadata["excludes"], list
-            ), f"'excludes' for key '{code}' should be a list"
-            for item in metadata["excludes"]:
-                assert isinstance(
-                    item, str
-                ), f"Items in 'excludes' for key '{code}' should be strings"
+    first = ClassificationMeta(code="A01xxx", title="first")
+    second = ClassificationMeta(code="A02xxx", title="second")
+
+    assert isinstance(first.includes, tuple) and not first.includes
+    assert first.includes is second.includes
+    assert first.excludes is second.excludes
+    assert {first: 1, second: 2}[ClassificationMeta(code="A01xxx", title="first")] == 1
+
+
+@pytest.mark.sic_meta
+def test_classification_meta_from_lists():
+    """Test that includes/excludes given as lists are stored as tuples."""
+    from_lists = ClassificationMeta(
+        code="A01xxx", title="Crops", includes=["wheat"], excludes=[]
+    )
+    from_tuples = ClassificationMeta(code="A01xxx", title="Crops", includes=("wheat",))
+
+    assert from_lists.includes == ("wheat",)
+    assert from_lists.excludes is from_tuples.excludes
+    assert from_lists == from_tuples
+    assert hash(from_lists) == hash(from_tuples)
+
+
+@pytest.mark.sic_meta
+def test_pretty_print_subset_digits():
+    """Test that pretty_print accepts a default, an int or an iterable subset."""
+    meta = ClassificationMeta(
+        code="A01xxx", title="Crops", includes=("wheat", "barley")
+    )
+    expected = "Code 01: Crops. Includes wheat, barley. "
+
+    assert meta.pretty_print() == expected
+    assert meta.pretty_print(2) == expected
+    assert meta.pretty_print([2, 5]) == expected
+    assert meta.pretty_print(frozenset({4})) == ""
+    assert meta.pretty_print([]) == ""
+
+
+@pytest.mark.sic_meta
+def test_classification_meta_parse():
+    """Test that parse validates its input before building an instance."""
+    data = {"code": "A01xxx", "title": "Crops", "includes": ["wheat"]}
+
+    assert ClassificationMeta.parse(data) == ClassificationMeta.from_dict(data)
+
+    for invalid in (
+        {"code": "A01xxx"},
+        {"code": "A01xxx", "title": 1},
+        {"code": "A01xxx", "title": "Crops", "includes": "wheat"},
+        {"code": "A01xxx", "title": "Crops", "notes": "unknown field"},
+    ):
+        with pytest.raises(ValidationError):
+            ClassificationMeta.parse(invalid)